@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import os
+import atexit
+from concurrent.futures.process import BrokenProcessPool
 from main import (
     load_data,
     clean_data,
@@ -8,8 +10,53 @@ from main import (
     export_report,
     generate_charts,
     embed_charts_in_excel,
+    make_chart_pool,
 )
 
+DATA_FILE = "household_expenses.xlsx"
+
+
+@st.cache_data(show_spinner="Loading data...", max_entries=1)
+def load_clean_data(file_path: str, mtime: float) -> pd.DataFrame:
+    """Load and clean the dataset once per file version; `mtime` keys the cache."""
+    return clean_data(load_data(file_path))
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def cached_analyze(_df: pd.DataFrame, data_key: tuple) -> dict:
+    """Analyze the dataset once per workbook version; `data_key` is its (path, mtime)."""
+    return analyze_data(_df)
+
+
+@st.cache_resource
+def chart_pool():
+    """Process pool shared by all sessions, kept warm for the server's lifetime."""
+    pool = make_chart_pool()
+    if pool is not None:
+        atexit.register(pool.shutdown, cancel_futures=True)
+    return pool
+
+
+@st.cache_data(show_spinner="Generating charts...", max_entries=1)
+def cached_generate_charts(_df: pd.DataFrame, data_key: tuple, charts_dir: str) -> dict:
+    """Render charts once per workbook version; `data_key` is its (path, mtime)."""
+    results = cached_analyze(_df, data_key)
+    try:
+        return generate_charts(_df, charts_dir, results, executor=chart_pool())
+    except BrokenProcessPool:
+        # A worker died; replace the pool and retry once
+        chart_pool().shutdown(cancel_futures=True)
+        chart_pool.clear()
+        return generate_charts(_df, charts_dir, results, executor=chart_pool())
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def build_report(_df: pd.DataFrame, data_key: tuple, output_excel: str, charts_dir: str) -> float:
+    """Write the Excel report with embedded charts; returns the report's mtime."""
+    export_report(output_excel, cached_analyze(_df, data_key))
+    embed_charts_in_excel(output_excel, cached_generate_charts(_df, data_key, charts_dir))
+    return os.path.getmtime(output_excel)
+
 
 def main():
     st.set_page_config(page_title="Household Expense Tracker", layout="wide")
@@ -21,19 +68,19 @@ def main():
     st.sidebar.title("Navigation")
     page = st.sidebar.selectbox("Choose a page", ["View Dataset", "Generate Analysis Report", "View Charts"])
 
-    # Load data once
-    if "expense_data" not in st.session_state:
-        with st.spinner("Loading data..."):
-            try:
-                df = load_data("household_expenses.xlsx")
-                df_clean = clean_data(df)
-                st.session_state.expense_data = df_clean
-                st.success("Data loaded successfully!")
-            except Exception as e:
-                st.error(f"Error loading data: {str(e)}")
-                return
+    # Load data (cached across sessions and reruns until the file changes)
+    try:
+        data_mtime = os.path.getmtime(DATA_FILE)
+        data_key = (DATA_FILE, data_mtime)
+        df = load_clean_data(*data_key)
+    except Exception as e:
+        st.error(f"Error loading data: {str(e)}")
+        return
 
-    df = st.session_state.expense_data
+    # Confirm once per session, and again whenever the workbook changes
+    if st.session_state.get("loaded_mtime") != data_mtime:
+        st.session_state.loaded_mtime = data_mtime
+        st.success("Data loaded successfully!")
 
     # Page 1: View Dataset
     if page == "View Dataset":
@@ -49,16 +96,16 @@ def main():
             with st.spinner("Generating analysis report..."):
                 try:
                     # Perform analysis
-                    results = analyze_data(df)
+                    results = cached_analyze(df, data_key)
 
-                    # Export report
+                    # Export report with embedded charts, unless the one on disk
+                    # was already built from this dataset
                     output_excel = "cleaned_expenses.xlsx"
-                    export_report(output_excel, results)
-
-                    # Generate charts
                     charts_dir = "charts"
-                    chart_paths = generate_charts(df, charts_dir)
-                    embed_charts_in_excel(output_excel, chart_paths)
+                    built_mtime = build_report(df, data_key, output_excel, charts_dir)
+                    if not os.path.exists(output_excel) or os.path.getmtime(output_excel) != built_mtime:
+                        build_report.clear()
+                        build_report(df, data_key, output_excel, charts_dir)
 
                     st.success("Analysis report generated successfully!")
 
@@ -105,19 +152,22 @@ def main():
         }
 
         if st.button("Generate Charts"):
-            with st.spinner("Generating charts..."):
-                try:
-                    chart_paths = generate_charts(df, charts_dir)
-                    st.success("Charts generated successfully!")
-                except Exception as e:
-                    st.error(f"Error generating charts: {str(e)}")
+            try:
+                charts = cached_generate_charts(df, data_key, charts_dir)
+                # Re-render if chart files were removed since they were cached
+                if not all(os.path.exists(path) for path, _ in charts.values()):
+                    cached_generate_charts.clear()
+                    charts = cached_generate_charts(df, data_key, charts_dir)
+                st.success("Charts generated successfully!")
+            except Exception as e:
+                st.error(f"Error generating charts: {str(e)}")
 
         # Display charts
         for chart_name, chart_file in chart_files.items():
             chart_path = os.path.join(charts_dir, chart_file)
             if os.path.exists(chart_path):
                 st.subheader(chart_name)
-                st.image(chart_path, use_column_width=True)
+                st.image(chart_path, width=800)
             else:
                 st.info(f"{chart_name} not found. Click 'Generate Charts' to create it.")
 
@@ -1,39 +1,188 @@
+import io
 import os
-from typing import Tuple, Dict, Any
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Tuple, Dict, Any, Iterable, List, Optional
+import numpy as np
 import pandas as pd
+import matplotlib
+matplotlib.use("Agg")  # headless: charts are only written to files
 import seaborn as sns
-import matplotlib.pyplot as plt
-from openpyxl import load_workbook
+from matplotlib.figure import Figure
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from openpyxl.drawing.image import Image as XLImage
 
+sns.set_theme(style="whitegrid")
+
 
 # 1) Excel File Reading
-def load_data(file_path: str) -> pd.DataFrame:
-    """Read household expenses dataset from Excel into a DataFrame."""
-    df = pd.read_excel(file_path)
+# Known schema, keyed by normalized column name. Applying it while loading
+# skips pandas' type inference; labels become categoricals in clean_data,
+# after their missing values have been filled.
+DEFAULT_DTYPES = {
+    "amount": "Int64",
+    "category": "string",
+    "payment_mode": "string",
+    "item": "string",
+    "notes": "string",
+}
+DEFAULT_PARSE_DATES = ["date"]
+
+
+def _normalize_column(name: Any) -> str:
+    """Column name as used throughout the analysis, e.g. 'Payment Mode' -> 'payment_mode'."""
+    return str(name).strip().replace(" ", "_").lower()
+
+
+def _row_width(row: Tuple[Any, ...]) -> int:
+    """Length of a row once trailing empty (or formatting-only) cells are dropped."""
+    for i in range(len(row) - 1, -1, -1):
+        if row[i] is not None and row[i] != "":
+            return i + 1
+    return 0
+
+
+def _header_names(header: Iterable[Any]) -> List[Any]:
+    """Name header cells like pd.read_excel: blanks become 'Unnamed: N', repeats get '.1', '.2', ..."""
+    raw = [f"Unnamed: {i}" if name is None else name for i, name in enumerate(header)]
+    taken = set(raw)
+    seen = set()
+    names: List[Any] = []
+    for name in raw:
+        if name in seen:
+            n = 1
+            while f"{name}.{n}" in taken:
+                n += 1
+            name = f"{name}.{n}"
+            taken.add(name)
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def load_data(file_path: str, columns: Optional[List[str]] = None,
+              dtype: Optional[Dict[str, str]] = None,
+              parse_dates: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read household expenses dataset from Excel into a DataFrame.
+
+    The first sheet is streamed in openpyxl read-only mode, so the full cell
+    object graph is never built. `columns` optionally restricts the result to
+    the given header names. `dtype` and `parse_dates` are matched against
+    normalized column names and default to DEFAULT_DTYPES / DEFAULT_PARSE_DATES;
+    columns that do not fit their dtype are left for clean_data to coerce.
+    """
+    dtype = DEFAULT_DTYPES if dtype is None else dtype
+    parse_dates = DEFAULT_PARSE_DATES if parse_dates is None else parse_dates
+
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        # The stored <dimension> tag can be wrong; read until the real end of data
+        ws.reset_dimensions()
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, ())
+        # Like pd.read_excel: trailing empty cells and rows are trimmed, blank
+        # rows inside the data are kept, short rows are padded with None
+        cells: List[list] = [[] for _ in range(_row_width(header))]
+        n_rows = blank_run = 0
+        for row in rows:
+            width = _row_width(row)
+            if width == 0:
+                blank_run += 1
+                continue
+            while len(cells) < width:
+                cells.append([None] * n_rows)
+            for _ in range(blank_run):
+                for col in cells:
+                    col.append(None)
+            n_rows += blank_run + 1
+            blank_run = 0
+            for i, col in enumerate(cells):
+                col.append(row[i] if i < width else None)
+    finally:
+        wb.close()
+    header = list(header[:len(cells)]) + [None] * (len(cells) - len(header))
+    data = {name: col for name, col in zip(_header_names(header), cells)
+            if columns is None or name in columns}
+    df = pd.DataFrame(data)
+
+    for col in df.columns:
+        key = _normalize_column(col)
+        if key in parse_dates:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+        elif key in dtype:
+            try:
+                df[col] = df[col].astype(dtype[key])
+            except (TypeError, ValueError):
+                pass
     return df
 
 
 # 2) Data Cleaning
-def _amount_is_valid(value: Any) -> bool:
-    """Check if expense amount is within a realistic range (100–50,000)."""
-    try:
-        v = int(value)
-        return 100 <= v <= 50000
-    except:
-        return False
+# Realistic expense amount range and expected payment mode categories
+AMOUNT_RANGE = (100, 50000)
+VALID_PAYMENT_MODES = {"Cash", "UPI", "Card", "NetBanking"}
 
 
-def _payment_mode_is_valid(value: Any) -> bool:
-    """Check if payment mode is one of the expected categories."""
-    valid_modes = {"Cash", "UPI", "Card", "NetBanking"}
-    return str(value).strip() in valid_modes
+# Below this many rows the NumPy paths win: importing Numba and loading its
+# compiled kernels costs more than the kernels save
+NUMBA_MIN_ROWS = 100_000
+
+
+@lru_cache(maxsize=None)
+def _numba_kernels() -> Optional[SimpleNamespace]:
+    """Import Numba and build the JIT kernels on first use; None if it is not installed.
+
+    Kernels compile on first call; cache=True keeps the machine code on disk.
+    """
+    try:
+        import numba
+    except ImportError:  # Numba is optional; plain NumPy is used without it
+        return None
+    # TBB hangs on interpreter exit when kernels run off the main thread (as
+    # under Streamlit), so prefer OpenMP unless a layer was chosen explicitly.
+    if "NUMBA_THREADING_LAYER" not in os.environ and "NUMBA_THREADING_LAYER_PRIORITY" not in os.environ:
+        numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+    @numba.njit(parallel=True, cache=True)
+    def amounts_in_range(amounts, low, high):
+        out = np.empty(amounts.size, np.bool_)
+        for i in numba.prange(amounts.size):
+            out[i] = low <= amounts[i] <= high
+        return out
+
+    # Serial on purpose: a prange scatter-add into shared bins would race
+    @numba.njit(cache=True)
+    def group_sum_count(codes, amounts, n_groups):
+        sums = np.zeros(n_groups, np.int64)
+        counts = np.zeros(n_groups, np.int64)
+        for i in range(amounts.size):
+            c = codes[i]
+            if c >= 0:
+                sums[c] += amounts[i]
+                counts[c] += 1
+        return sums, counts
+
+    return SimpleNamespace(amounts_in_range=amounts_in_range, group_sum_count=group_sum_count)
+
+
+def _validate_amounts(amounts: np.ndarray) -> np.ndarray:
+    """Return a boolean mask of amounts within AMOUNT_RANGE."""
+    low, high = AMOUNT_RANGE
+    kernels = _numba_kernels() if amounts.size >= NUMBA_MIN_ROWS else None
+    if kernels is None:
+        return (amounts >= low) & (amounts <= high)
+    return kernels.amounts_in_range(np.ascontiguousarray(amounts, dtype=np.int64), low, high)
 
 
 def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """Clean dataset: handle missing values, duplicates, types, and validations."""
     # Standardize column names
-    df.columns = df.columns.str.strip().str.replace(" ", "_").str.lower()
+    df.columns = [_normalize_column(c) for c in df.columns]
 
     # Fill missing values
     df = df.fillna({
@@ -43,174 +192,285 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
         "category": "Misc"
     })
 
-    # Remove duplicates
-    df = df.drop_duplicates()
-
-    # Convert amount to int
+    # Convert amount to int (already an integer dtype when load_data applied the schema)
     if "amount" in df.columns:
-        df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0).astype(int)
+        if pd.api.types.is_integer_dtype(df["amount"]):
+            df["amount"] = df["amount"].astype(int)
+        else:
+            df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0).astype(int)
 
     # Ensure date is datetime
-    if "date" in df.columns:
+    if "date" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["date"]):
         df["date"] = pd.to_datetime(df["date"], errors="coerce")
 
-    # Validation flags
-    df["amount_valid"] = df["amount"].apply(_amount_is_valid)
-    df["payment_mode_valid"] = df["payment_mode"].apply(_payment_mode_is_valid)
+    # Remove duplicates, keyed on the identifying columns (after type conversion,
+    # so rows are hashed on narrow numeric/datetime values; free-text notes are skipped)
+    key_cols = [c for c in ("date", "category", "item", "amount", "payment_mode") if c in df.columns]
+    df = df.drop_duplicates(subset=key_cols or None)
+
+    # Validation flags (vectorized; unparseable amounts were coerced to 0 above)
+    df["amount_valid"] = _validate_amounts(df["amount"].to_numpy())
+    df["payment_mode_valid"] = df["payment_mode"].astype(str).str.strip().isin(VALID_PAYMENT_MODES)
+
+    # Low-cardinality labels as categoricals: groupby/value_counts work on int codes
+    for col in ("category", "payment_mode"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
 
     return df
 
 
 # 3) Data Analysis
+def _category_sums(codes: np.ndarray, amounts: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return per-category (sum, count) arrays for categorical codes (-1 = missing).
+
+    Sums keep integer amounts exact and stay float for float amounts.
+    """
+    integer = np.issubdtype(amounts.dtype, np.integer)
+    kernels = _numba_kernels() if integer and amounts.size >= NUMBA_MIN_ROWS else None
+    if kernels is not None:
+        return kernels.group_sum_count(codes, np.ascontiguousarray(amounts, dtype=np.int64), n_groups)
+    valid = codes >= 0
+    sums = np.bincount(codes[valid], weights=amounts[valid], minlength=n_groups)
+    if integer:
+        sums = sums.astype(np.int64)
+    counts = np.bincount(codes[valid], minlength=n_groups)
+    return sums, counts
+
+
 def analyze_data(df: pd.DataFrame) -> Dict[str, Any]:
     """Perform insights like mean, max, grouping, counts, filtering."""
     results = {}
-
-    # Average, Max, Min
-    results["average_expense"] = df["amount"].mean()
-    results["max_expense"] = df["amount"].max()
-    results["min_expense"] = df["amount"].min()
-
-    # Group by category
-    results["category_totals"] = df.groupby("category")["amount"].sum().sort_values(ascending=False)
-
-    # Category averages
-    results["category_averages"] = df.groupby("category")["amount"].mean().sort_values(ascending=False)
+    # Extract the amount column once; the stats, groupings and filter below reuse it
+    amt = df["amount"].to_numpy()
+
+    # Average, Max, Min (NaN for an empty dataset, as pandas would give)
+    if amt.size:
+        results["average_expense"] = amt.mean()
+        results["max_expense"] = amt.max()
+        results["min_expense"] = amt.min()
+    else:
+        results["average_expense"] = results["max_expense"] = results["min_expense"] = np.nan
+
+    # Category totals and averages from one pass over the categorical codes
+    cats = df["category"].astype("category").cat
+    sums, counts = _category_sums(cats.codes.to_numpy(), amt, len(cats.categories))
+    observed = counts > 0
+    categories = pd.Index(cats.categories[observed], name="category")
+    results["category_totals"] = pd.Series(sums[observed], index=categories, name="amount") \
+        .sort_values(ascending=False)
+    results["category_averages"] = pd.Series(sums[observed] / counts[observed], index=categories, name="amount") \
+        .sort_values(ascending=False)
 
     # Payment mode counts
     results["payment_counts"] = df["payment_mode"].value_counts()
 
-    # Monthly totals
+    # Monthly totals, grouped on datetime64[M] codes rather than Period objects
     if "date" in df.columns:
-        df["month"] = df["date"].dt.to_period("M")
-        results["monthly_totals"] = df.groupby("month")["amount"].sum()
+        month_codes = df["date"].to_numpy().astype("datetime64[M]")
+        results["monthly_totals"] = df["amount"].groupby(month_codes).sum().rename_axis("month")
     else:
-        results["monthly_totals"] = pd.Series()
+        results["monthly_totals"] = pd.Series(dtype="int64", index=pd.DatetimeIndex([], name="month"))
 
     # Top 5 expensive items
-    results["top5_items"] = df.sort_values(by="amount", ascending=False).head(5)
+    results["top5_items"] = df.nlargest(5, "amount")
 
     # Filter > 5000
-    results["above_5000"] = df[df["amount"] > 5000]
-
-    # Sort all expenses
-    results["sorted_expenses"] = df.sort_values(by="amount", ascending=False)
+    results["above_5000"] = df.iloc[np.flatnonzero(amt > 5000)]
 
     return results
 
 
 # 4) Report Generation
+def _cell_value(value: Any) -> Any:
+    """Convert a pandas value into something openpyxl can write."""
+    if pd.isna(value):
+        return None
+    return value
+
+
+def _write_rows(wb: Workbook, sheet_name: str, header: List[str], rows: Iterable[Iterable[Any]]) -> None:
+    """Append a bold header row and then plain value rows to a new write-only sheet."""
+    ws = wb.create_sheet(sheet_name)
+    header_cells = []
+    for name in header:
+        cell = WriteOnlyCell(ws, value=str(name))
+        cell.font = Font(bold=True)
+        header_cells.append(cell)
+    ws.append(header_cells)
+    for row in rows:
+        ws.append([_cell_value(v) for v in row])
+
+
+def _write_sheet(wb: Workbook, sheet_name: str, frame: pd.DataFrame) -> None:
+    """Stream a DataFrame into a new write-only sheet, header row first."""
+    _write_rows(wb, sheet_name, list(frame.columns), frame.itertuples(index=False, name=None))
+
+
 def export_report(output_path: str, results: Dict[str, Any]) -> None:
-    """Save analysis results into an Excel file with multiple sheets."""
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        # Summary
-        pd.DataFrame({
-            "Average Expense": [results["average_expense"]],
-            "Max Expense": [results["max_expense"]],
-            "Min Expense": [results["min_expense"]]
-        }).to_excel(writer, sheet_name="Summary", index=False)
+    """Save analysis results into an Excel file with multiple sheets.
 
-        # Category totals
-        results["category_totals"].rename_axis("Category").reset_index(name="Total Amount") \
-            .to_excel(writer, sheet_name="Category Totals", index=False)
+    Rows are streamed through a write-only openpyxl workbook, so the full
+    cell object graph is never held in memory. The small key/value sheets
+    are appended directly instead of being wrapped in DataFrames first.
+    """
+    wb = Workbook(write_only=True)
 
-        # Category averages
-        results["category_averages"].rename_axis("Category").reset_index(name="Avg Amount") \
-            .to_excel(writer, sheet_name="Category Averages", index=False)
+    # Summary
+    _write_rows(wb, "Summary", ["Average Expense", "Max Expense", "Min Expense"],
+                [(results["average_expense"], results["max_expense"], results["min_expense"])])
 
-        # Payment modes
-        results["payment_counts"].rename_axis("Payment Mode").reset_index(name="Count") \
-            .to_excel(writer, sheet_name="Payment Modes", index=False)
+    # Category totals
+    _write_rows(wb, "Category Totals", ["Category", "Total Amount"], results["category_totals"].items())
 
-        # Monthly totals
-        results["monthly_totals"].rename_axis("Month").reset_index(name="Total Amount") \
-            .to_excel(writer, sheet_name="Monthly Totals", index=False)
+    # Category averages
+    _write_rows(wb, "Category Averages", ["Category", "Avg Amount"], results["category_averages"].items())
 
-        # Top 5 items
-        results["top5_items"].to_excel(writer, sheet_name="Top 5 Items", index=False)
+    # Payment modes
+    _write_rows(wb, "Payment Modes", ["Payment Mode", "Count"], results["payment_counts"].items())
 
-        # Above 5000
-        results["above_5000"].to_excel(writer, sheet_name="Above 5000", index=False)
+    # Monthly totals
+    monthly = results["monthly_totals"]
+    _write_rows(wb, "Monthly Totals", ["Month", "Total Amount"],
+                zip(monthly.index.strftime("%Y-%m"), monthly.to_numpy()))
+
+    # Top 5 items
+    _write_sheet(wb, "Top 5 Items", results["top5_items"])
 
-        # Sorted
-        results["sorted_expenses"].to_excel(writer, sheet_name="Sorted Expenses", index=False)
+    # Above 5000
+    _write_sheet(wb, "Above 5000", results["above_5000"])
 
-        # Charts placeholder
-        pd.DataFrame({"Charts": ["See embedded images"]}).to_excel(writer, sheet_name="Charts", index=False)
+    # Charts placeholder
+    _write_rows(wb, "Charts", ["Charts"], [("See embedded images",)])
+
+    wb.save(output_path)
 
 
 # 5) Charts & Visualization
-def generate_charts(df: pd.DataFrame, charts_dir: str) -> Dict[str, str]:
+# Charts are shown at screen resolution, so higher DPI only adds encoding time
+CHART_DPI = 100
+
+
+def _save_png(fig: Figure, path: str) -> bytes:
+    """Encode a figure to PNG once, write it to `path` and return the bytes."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=CHART_DPI)
+    png = buf.getvalue()
+    with open(path, "wb") as f:
+        f.write(png)
+    return png
+
+
+def _render_bar(totals: pd.Series, path: str) -> Tuple[str, bytes]:
+    """Bar: Expenses by Category."""
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    # Plain strings keep the bars in total order (seaborn follows categorical order)
+    sns.barplot(x=totals.index.astype(str), y=totals.values, palette="Blues_d", ax=ax)
+    ax.set_title("Expenses by Category")
+    ax.set_xlabel("Category")
+    ax.set_ylabel("Total Amount")
+    fig.tight_layout()
+    return path, _save_png(fig, path)
+
+
+def _render_pie(counts: pd.Series, path: str) -> Tuple[str, bytes]:
+    """Pie: Payment Mode Distribution."""
+    fig = Figure(figsize=(6, 6))
+    ax = fig.subplots()
+    counts.plot(kind="pie", autopct="%1.1f%%", startangle=90, ax=ax)
+    ax.set_title("Payment Mode Distribution")
+    ax.set_ylabel("")
+    fig.tight_layout()
+    return path, _save_png(fig, path)
+
+
+def _render_line(monthly: pd.Series, path: str) -> Tuple[str, bytes]:
+    """Line: Monthly Totals."""
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.plot(monthly.index.strftime("%Y-%m"), monthly.values, marker="o")
+    ax.set_title("Monthly Expenses Over Time")
+    ax.set_xlabel("Month")
+    ax.set_ylabel("Total Amount")
+    fig.tight_layout()
+    return path, _save_png(fig, path)
+
+
+def _render_hist(amounts: pd.Series, path: str) -> Tuple[str, bytes]:
+    """Histogram: Expense Distribution."""
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    sns.histplot(amounts, bins=15, kde=True, color="#4C72B0", ax=ax)
+    ax.set_title("Expense Distribution")
+    ax.set_xlabel("Amount")
+    ax.set_ylabel("Frequency")
+    fig.tight_layout()
+    return path, _save_png(fig, path)
+
+
+def make_chart_pool() -> Optional[ProcessPoolExecutor]:
+    """Process pool for generate_charts in long-lived apps such as the GUI.
+
+    Workers are spawned (safe from threaded hosts like Streamlit) and stay
+    warm between calls; the caller owns the pool and must shut it down.
+    Returns None on a single core, where a process pool only adds overhead.
+    """
+    workers = min(4, os.cpu_count() or 1)
+    if workers == 1:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def generate_charts(df: pd.DataFrame, charts_dir: str, results: Dict[str, Any],
+                    executor: Optional[Executor] = None) -> Dict[str, Tuple[str, bytes]]:
+    """Render chart PNGs, reusing the aggregates already computed by analyze_data.
+
+    Returns `{label: (path, png_bytes)}`; the bytes let callers such as
+    embed_charts_in_excel skip reading the files back from disk.
+
+    Each chart is rendered by a top-level _render_* function taking only
+    picklable inputs. By default they are drawn on a short-lived thread pool;
+    long-lived callers can pass a pool from make_chart_pool() as `executor`.
+    """
     os.makedirs(charts_dir, exist_ok=True)
-    paths: Dict[str, str] = {}
-    sns.set_theme(style="whitegrid")
-
-    # Bar: Expenses by Category
-    plt.figure(figsize=(8, 5))
-    totals = df.groupby("category")["amount"].sum().sort_values(ascending=False)
-    sns.barplot(x=totals.index, y=totals.values, palette="Blues_d")
-    plt.title("Expenses by Category")
-    plt.xlabel("Category")
-    plt.ylabel("Total Amount")
-    cat_path = os.path.join(charts_dir, "category_expenses_bar.png")
-    plt.tight_layout()
-    plt.savefig(cat_path, dpi=150)
-    plt.close()
-    paths["category_bar"] = cat_path
-
-    # Pie: Payment Mode Distribution
-    plt.figure(figsize=(6, 6))
-    df["payment_mode"].value_counts().plot(kind="pie", autopct="%1.1f%%", startangle=90)
-    plt.title("Payment Mode Distribution")
-    plt.ylabel("")
-    pie_path = os.path.join(charts_dir, "payment_mode_pie.png")
-    plt.tight_layout()
-    plt.savefig(pie_path, dpi=150)
-    plt.close()
-    paths["payment_pie"] = pie_path
-
-    # Line: Monthly Totals
-    if "date" in df.columns:
-        plt.figure(figsize=(10, 5))
-        monthly = df.groupby(df["date"].dt.to_period("M"))["amount"].sum()
-        plt.plot(monthly.index.astype(str), monthly.values, marker="o")
-        plt.title("Monthly Expenses Over Time")
-        plt.xlabel("Month")
-        plt.ylabel("Total Amount")
-        line_path = os.path.join(charts_dir, "monthly_expenses_line.png")
-        plt.tight_layout()
-        plt.savefig(line_path, dpi=150)
-        plt.close()
-        paths["monthly_line"] = line_path
-
-    # Histogram: Expense Distribution
-    plt.figure(figsize=(8, 5))
-    sns.histplot(df["amount"], bins=15, kde=True, color="#4C72B0")
-    plt.title("Expense Distribution")
-    plt.xlabel("Amount")
-    plt.ylabel("Frequency")
-    hist_path = os.path.join(charts_dir, "expense_hist.png")
-    plt.tight_layout()
-    plt.savefig(hist_path, dpi=150)
-    plt.close()
-    paths["histogram"] = hist_path
-
-    return paths
-
-
-def embed_charts_in_excel(excel_path: str, chart_paths: Dict[str, str]) -> None:
+
+    jobs = {
+        "category_bar": (_render_bar, results["category_totals"], "category_expenses_bar.png"),
+        "payment_pie": (_render_pie, results["payment_counts"], "payment_mode_pie.png"),
+    }
+    line_file = "monthly_expenses_line.png"
+    if not results["monthly_totals"].empty:
+        jobs["monthly_line"] = (_render_line, results["monthly_totals"], line_file)
+    elif os.path.exists(os.path.join(charts_dir, line_file)):
+        # No dated rows: drop a line chart left by an earlier run so it isn't shown as current
+        os.remove(os.path.join(charts_dir, line_file))
+    jobs["histogram"] = (_render_hist, df["amount"], "expense_hist.png")
+
+    pool = executor or ThreadPoolExecutor(max_workers=len(jobs))
+    try:
+        futures = {
+            label: pool.submit(render, data, os.path.join(charts_dir, file_name))
+            for label, (render, data, file_name) in jobs.items()
+        }
+        return {label: future.result() for label, future in futures.items()}
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+
+def embed_charts_in_excel(excel_path: str, charts: Dict[str, Tuple[str, bytes]]) -> None:
     wb = load_workbook(excel_path)
     if "Charts" not in wb.sheetnames:
         wb.create_sheet("Charts")
     ws = wb["Charts"]
 
     row = 1
-    for label, path in chart_paths.items():
-        if os.path.exists(path):
-            img = XLImage(path)
-            cell = f"A{row}"
-            ws.add_image(img, cell)
-            row += 20
+    for label, (path, png) in charts.items():
+        img = XLImage(io.BytesIO(png))
+        cell = f"A{row}"
+        ws.add_image(img, cell)
+        row += 20
     wb.save(excel_path)
 
 
@@ -233,8 +493,8 @@ def main():
     export_report(output_excel, results)
 
     # Charts
-    chart_paths = generate_charts(df_clean, charts_dir)
-    embed_charts_in_excel(output_excel, chart_paths)
+    charts = generate_charts(df_clean, charts_dir, results)
+    embed_charts_in_excel(output_excel, charts)
 
     # Console summary
     print("\nExpense Analysis Report")